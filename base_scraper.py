@@ -1,18 +1,136 @@
 #!/usr/bin/env python3
 """
 Universal Web Scraper Orchestrator - Enhanced with URL Deduplication
-Maintains a single JSON file and prevents duplicate scraping
+Maintains append-only record files with a master summary and prevents duplicate scraping
 """
 
+import asyncio
+import hashlib
+import io
+import itertools
 import json
+import logging
+import math
 import os
+import struct
 import sys
 from datetime import datetime
+from operator import itemgetter
+from urllib.parse import urlsplit, urlunsplit
 from pathlib import Path
+import importlib
 import importlib.util
+import inspect
+import pkgutil
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple, Union
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional, URL hashes then use blake2b
+    xxhash = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, legacy master files are then loaded whole
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Record ids are drawn from a pool filled with one urandom call per batch
+_UUID_BATCH = 256
+_UUID_POOL = deque()
+
+
+def _next_uuid() -> str:
+    """Return a random (version 4) UUID as a hex string"""
+    try:
+        return _UUID_POOL.popleft()
+    except IndexError:
+        entropy = os.urandom(16 * _UUID_BATCH)
+        ids = [uuid.UUID(bytes=entropy[i:i + 16], version=4).hex for i in range(0, len(entropy), 16)]
+        _UUID_POOL.extend(ids[1:])
+        return ids[0]
+
+
+# Query parameters that only track the visitor and never change the page
+_TRACKING_PARAMS = frozenset({'gclid', 'fbclid', 'mc_cid', 'mc_eid'})
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name.startswith('utm_') or name in _TRACKING_PARAMS
+
+
+def _normalize_url(url: str) -> str:
+    """Lowercase scheme and host, drop the fragment and tracking query parameters"""
+    parts = urlsplit(url.strip())
+    query = parts.query
+    if query:
+        query = '&'.join(
+            pair for pair in query.split('&')
+            if pair and not _is_tracking_param(pair.split('=', 1)[0])
+        )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+def _url_hash_name() -> str:
+    """Name of the hash _url_hash currently uses; persisted URL filters record it"""
+    return 'xxh64' if xxhash is not None else 'blake2b'
+
+
+def _url_hash(url: str) -> int:
+    """64-bit hash of the normalized URL, used for all duplicate checks"""
+    data = _normalize_url(url).encode('utf-8')
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a value to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _write_bytes_atomic(path: Path, data: bytes):
+    """Write a file via a temporary sibling so readers never see a partial write"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _write_json(path: Path, data: Any):
+    """Atomically write indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    _write_bytes_atomic(path, payload)
+
 
 class BaseScraperInterface(ABC):
     """Abstract base class that all website scrapers must implement"""
@@ -37,12 +155,129 @@ class BaseScraperInterface(ABC):
         """Validate if date format is supported by this scraper"""
         pass
 
+def _is_scraper_class(obj: Any) -> bool:
+    """True for classes deriving from a BaseScraperInterface"""
+    # Compare by name: scrapers may define their own copy of the interface
+    return (isinstance(obj, type) and
+            obj.__name__ != 'BaseScraperInterface' and
+            any(base.__name__ == 'BaseScraperInterface' for base in obj.__mro__))
+
+class BloomDedup:
+    """Compact probabilistic URL set used for duplicate pre-checks
+    
+    Items are 64-bit URL hashes (see _url_hash). Membership tests never miss
+    an item that was added; false positives occur at roughly ``error_rate``
+    while the filter holds at most ``capacity`` items. Scoped views share the
+    bit array of their parent, so one filter can serve every scraper while
+    keeping their URLs apart.
+    """
+    
+    # One magic per URL hash: a filter built from xxh64 hashes is useless once
+    # xxhash is uninstalled (and vice versa), so such files are rebuilt
+    _MAGICS = {'xxh64': b'BLX3', 'blake2b': b'BLB3'}
+    _HEADER = struct.Struct('<4sQQQQd')
+    
+    def __init__(self, capacity: int = 100000, error_rate: float = 1e-6):
+        self.capacity = max(int(capacity), 1)
+        self.error_rate = error_rate
+        self.num_bits = max(64, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+        self.prefix = b''
+        self._root = self
+    
+    def _positions(self, item: int) -> List[int]:
+        digest = hashlib.blake2b(self.prefix + item.to_bytes(8, 'little'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    def add(self, item: int):
+        """Add an item to the filter"""
+        bits = self.bits
+        added = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                added = True
+        # Re-adding an item already present sets no new bit and is not counted
+        if added:
+            self._root.count += 1
+    
+    def __contains__(self, item: int) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+    
+    def __len__(self) -> int:
+        """Approximate number of distinct items across all scopes of the filter"""
+        return self._root.count
+    
+    def is_saturated(self) -> bool:
+        """True once more items were added than the filter was sized for"""
+        return self._root.count > self.capacity
+    
+    def scoped(self, scope: str) -> 'BloomDedup':
+        """Return a view whose items are namespaced by ``scope``"""
+        view = object.__new__(BloomDedup)
+        view.__dict__.update(self.__dict__)
+        view.prefix = f"{scope}\n".encode('utf-8')
+        return view
+    
+    def to_bytes(self) -> bytes:
+        """Serialize the filter for persisting next to the master file"""
+        header = self._HEADER.pack(self._MAGICS[_url_hash_name()], self.capacity, self.num_bits, self.num_hashes,
+                                   self._root.count, self.error_rate)
+        return header + bytes(self.bits)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomDedup':
+        """Rebuild a filter previously serialized with to_bytes"""
+        magic, capacity, num_bits, num_hashes, count, error_rate = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGICS[_url_hash_name()]:
+            if magic in cls._MAGICS.values():
+                raise ValueError("Bloom filter was built with a different URL hash")
+            raise ValueError("Unsupported bloom filter format")
+        bloom = object.__new__(cls)
+        bloom.capacity = capacity
+        bloom.error_rate = error_rate
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.bits = bytearray(data[cls._HEADER.size:])
+        bloom.count = count
+        bloom.prefix = b''
+        bloom._root = bloom
+        if len(bloom.bits) != (num_bits + 7) // 8:
+            raise ValueError("Truncated bloom filter data")
+        return bloom
+
+# Category labels repeat across records, so share one string object per label
+_CATEGORY_INTERN: Dict[str, str] = {}
+
+
+def _intern_category(category: str) -> str:
+    """Return the shared string object for a category label"""
+    return _CATEGORY_INTERN.setdefault(category, sys.intern(category))
+
+# Fields copied into standardized records; anything else is kept under raw_data
+ANNOUNCEMENT_KNOWN_KEYS = frozenset({'id', 'title', 'url', 'date', 'category', 'excerpt'})
+CONTENT_KNOWN_KEYS = frozenset({
+    'id', 'url', 'title', 'date_published', 'full_content', 'word_count', 'images',
+    'links', 'contact_info', 'tags', 'comments', 'metadata'
+})
+
 class ScraperResult:
-    """Standardized result container with deduplication support"""
+    """Standardized result container with deduplication support
+    
+    Records don't repeat the source website or scrape time; both are stored
+    once per session in scraper_info and in the record files' session headers.
+    """
     
-    def __init__(self, scraper_name: str, website: str, existing_urls: Set[str] = None):
+    def __init__(self, scraper_name: str, website: str, existing_urls: Union[Set[int], BloomDedup] = None,
+                 preserve_raw_data: bool = False):
         self.scraper_name = scraper_name
-        self.website = website
+        self.website = sys.intern(website)
         self.scraped_at = datetime.now().isoformat()
         self.session_id = str(uuid.uuid4())
         self.announcements = []
@@ -52,47 +287,79 @@ class ScraperResult:
         self.statistics = {}
         self.existing_urls = existing_urls or set()
         self.new_urls = set()
+        self.new_content_urls = set()
         self.skipped_duplicates = 0
+        self.preserve_raw_data = preserve_raw_data
+    
+    def _check_and_record_url(self, url: str) -> bool:
+        """Return True if an announcement URL is new, remembering it for this session"""
+        if not url:
+            return True
+        url_hash = _url_hash(url)
+        if url_hash in self.existing_urls:
+            self.skipped_duplicates += 1
+            return False
+        self.new_urls.add(url_hash)
+        return True
+    
+    def _check_and_record_content_url(self, url: str) -> bool:
+        """Return True if a full content URL is new, remembering it for this session"""
+        if not url:
+            return True
+        url_hash = _url_hash(url)
+        if url_hash in self.existing_urls or url_hash in self.new_content_urls:
+            self.skipped_duplicates += 1
+            return False
+        self.new_content_urls.add(url_hash)
+        return True
     
     def add_announcement(self, announcement: Dict[str, Any]):
         """Add announcement if URL is not a duplicate"""
-        url = announcement.get('url', '')
-        
-        if url and url in self.existing_urls:
-            self.skipped_duplicates += 1
+        if not self._check_and_record_url(announcement.get('url', '')):
             return False  # Skip duplicate
         
-        standardized = self._standardize_announcement(announcement)
-        self.announcements.append(standardized)
-        
-        if url:
-            self.new_urls.add(url)
-        
+        self.announcements.append(self._standardize_announcement(announcement))
         return True  # Added new item
     
+    def add_announcements_bulk(self, announcements: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add all non-duplicate announcements, returning the standardized new ones"""
+        new = [self._standardize_announcement(a) for a in announcements
+               if self._check_and_record_url(a.get('url', ''))]
+        self.announcements.extend(new)
+        return new
+    
     def add_full_content(self, content: Dict[str, Any]):
-        """Add full content"""
-        standardized = self._standardize_content(content)
-        self.full_content.append(standardized)
+        """Add full content if URL is not a duplicate"""
+        if not self._check_and_record_content_url(content.get('url', '')):
+            return False  # Skip duplicate
+        
+        self.full_content.append(self._standardize_content(content))
+        return True  # Added new item
+    
+    def add_full_content_bulk(self, contents: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add all non-duplicate full content, returning the standardized new items"""
+        new = [self._standardize_content(c) for c in contents
+               if self._check_and_record_content_url(c.get('url', ''))]
+        self.full_content.extend(new)
+        return new
     
     def _standardize_announcement(self, announcement: Dict[str, Any]) -> Dict[str, Any]:
         """Standardize announcement format"""
-        return {
-            'id': announcement.get('id', str(uuid.uuid4())),
+        standardized = {
+            'id': announcement['id'] if 'id' in announcement else _next_uuid(),
             'title': announcement.get('title', ''),
             'url': announcement.get('url', ''),
             'date': announcement.get('date', ''),
-            'category': announcement.get('category', 'General'),
-            'excerpt': announcement.get('excerpt', ''),
-            'source_website': self.website,
-            'scraped_at': self.scraped_at,
-            'raw_data': announcement  # Preserve original data
+            'category': _intern_category(announcement.get('category', 'General')),
+            'excerpt': announcement.get('excerpt', '')
         }
+        self._attach_raw_data(standardized, announcement, ANNOUNCEMENT_KNOWN_KEYS)
+        return standardized
     
     def _standardize_content(self, content: Dict[str, Any]) -> Dict[str, Any]:
         """Standardize full content format"""
-        return {
-            'id': content.get('id', str(uuid.uuid4())),
+        standardized = {
+            'id': content['id'] if 'id' in content else _next_uuid(),
             'url': content.get('url', ''),
             'title': content.get('title', ''),
             'date_published': content.get('date_published', ''),
@@ -103,11 +370,20 @@ class ScraperResult:
             'contact_info': content.get('contact_info', ''),
             'tags': content.get('tags', []),
             'comments': content.get('comments', []),
-            'metadata': content.get('metadata', {}),
-            'source_website': self.website,
-            'scraped_at': self.scraped_at,
-            'raw_data': content  # Preserve original data
+            'metadata': content.get('metadata', {})
         }
+        self._attach_raw_data(standardized, content, CONTENT_KNOWN_KEYS)
+        return standardized
+    
+    def _attach_raw_data(self, standardized: Dict[str, Any], original: Dict[str, Any], known_keys: frozenset):
+        """Keep the original record, or only the fields the standard format doesn't cover"""
+        if self.preserve_raw_data:
+            standardized['raw_data'] = original
+            return
+        
+        extra = {k: v for k, v in original.items() if k not in known_keys}
+        if extra:
+            standardized['raw_data'] = extra
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -135,129 +411,503 @@ class ScraperResult:
 class ScraperOrchestrator:
     """Main orchestrator with deduplication support"""
     
-    def __init__(self, scrapers_directory: str = "scrapers", output_directory: str = "scraped_data", master_file: str = "master_scraped_data.json"):
+    def __init__(self, scrapers_directory: str = "scrapers", output_directory: str = "scraped_data", master_file: str = "master_scraped_data.json",
+                 max_concurrency: int = 5, preserve_raw_data: bool = False):
         self.scrapers_directory = Path(scrapers_directory)
         self.output_directory = Path(output_directory)
         self.output_directory.mkdir(exist_ok=True)
         self.master_file_path = self.output_directory / master_file
+        self.bloom_file_path = self.master_file_path.with_suffix('.bloom')
+        self.discovery_cache_path = self.output_directory / '.scraper_discovery_cache.json'
+        
+        # Records live in append-only NDJSON files; the master file only keeps
+        # history, summary and per-scraper statistics
+        master_stem = self.master_file_path.stem
+        self.record_file_paths = {
+            'announcements': self.output_directory / f"{master_stem}.announcements.ndjson",
+            'full_content': self.output_directory / f"{master_stem}.full_content.ndjson"
+        }
         
+        self.max_concurrency = max(1, max_concurrency)
+        self.preserve_raw_data = preserve_raw_data
         self.loaded_scrapers = {}
         self.results = {}
+        
+        # Parsed master file and URL index, reused until the file changes on disk
+        self._existing_data_cache = None
+        self._existing_data_mtime = None
+        self._url_index: Optional[Dict[str, Set[int]]] = None
+        self._all_urls: Set[int] = set()
+        self._bloom: Optional[BloomDedup] = None
+    
+    def _invalidate_cache(self):
+        """Drop the cached master data and URL index"""
+        self._existing_data_cache = None
+        self._existing_data_mtime = None
+        self._url_index = None
+        self._all_urls = set()
+    
+    def iter_records(self, section: str, scraper_name: str = None) -> Iterator[Dict[str, Any]]:
+        """Stream stored 'announcements' or 'full_content' records, optionally for one scraper
+        
+        Session-level fields (source_website, scraped_at) are stored once per session
+        header and merged back into each yielded record.
+        """
+        for session, record in self._iter_record_sessions(self.record_file_paths[section]):
+            if scraper_name is None or session.get('scraper') == scraper_name:
+                merged = dict(record)
+                for key in ('source_website', 'scraped_at'):
+                    if key in session:
+                        merged.setdefault(key, session[key])
+                yield merged
+    
+    def _iter_record_sessions(self, path: Path) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Yield (session header, record) pairs from an NDJSON record file"""
+        if not path.exists():
+            return
+        
+        session = {}
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = _loads(line)
+                except Exception as e:
+                    # A crash mid-append can leave a truncated last line
+                    logger.warning("Skipping unreadable line in %s: %s", path, e)
+                    continue
+                
+                header = record.get('_session')
+                if header is not None:
+                    session = header
+                    continue
+                yield session, record
+    
+    def _iter_record_file(self, path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (scraper_name, record) pairs from an NDJSON record file"""
+        for session, record in self._iter_record_sessions(path):
+            yield session.get('scraper'), record
+    
+    def _terminate_partial_line(self, path: Path):
+        """End a truncated last line so the next session header starts on its own line"""
+        # A crash mid-append can leave the file without its final newline; appending
+        # straight after it would glue the header onto the unreadable partial record
+        try:
+            with open(path, 'rb+') as f:
+                if f.seek(0, os.SEEK_END) == 0:
+                    return
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+        except FileNotFoundError:
+            pass
+    
+    def _append_records(self, path: Path, session: Dict[str, Any], records: List[Dict[str, Any]]):
+        """Append one session's records to an NDJSON file behind a session header line"""
+        if not records:
+            return
+        
+        self._terminate_partial_line(path)
+        with io.BufferedWriter(io.FileIO(path, 'a'), buffer_size=1 << 20) as f:
+            f.write(_dumps({'_session': session}) + b'\n')
+            for record in records:
+                f.write(_dumps(record) + b'\n')
+    
+    def _legacy_session(self, scraper_name: str, scraper_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Session header for records migrated from a monolithic master file"""
+        return {
+            'scraper': scraper_name,
+            'session_id': scraper_info.get('session_id'),
+            'source_website': scraper_info.get('website'),
+            'scraped_at': scraper_info.get('scraped_at')
+        }
+    
+    def _migration_targets(self) -> Dict[str, Path]:
+        """Temporary paths for the record files a legacy migration still has to write
+        
+        A record file that already exists means an earlier migration got as far as
+        promoting it before it was interrupted, so its section is not written again.
+        """
+        targets = {}
+        for section, path in self.record_file_paths.items():
+            if path.exists():
+                logger.warning("%s already exists, not migrating legacy %s records again", path, section)
+                continue
+            tmp_path = path.with_name(path.name + '.tmp')
+            tmp_path.unlink(missing_ok=True)
+            targets[section] = tmp_path
+        return targets
+    
+    def _promote_migrated(self, targets: Dict[str, Path]):
+        """Move fully written record files into place, before the master is slimmed"""
+        for section, tmp_path in targets.items():
+            if tmp_path.exists():
+                os.replace(tmp_path, self.record_file_paths[section])
+    
+    def _migrate_legacy_master(self, existing_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Move records out of a monolithic master file into the NDJSON record files"""
+        logger.info("Migrating records from %s to NDJSON record files...", self.master_file_path)
+        
+        targets = self._migration_targets()
+        for scraper_name, scraper_data in existing_data.get('results_by_scraper', {}).items():
+            session = self._legacy_session(scraper_name, scraper_data.get('scraper_info', {}))
+            for section in self.record_file_paths:
+                records = scraper_data.pop(section, None)
+                if section in targets:
+                    self._append_records(targets[section], session, records)
+        
+        self._promote_migrated(targets)
+        _write_json(self.master_file_path, existing_data)
+        return existing_data
+    
+    def _legacy_record_prefix(self, prefix: str) -> Optional[Tuple[str, str]]:
+        """Match an ijson prefix of the form results_by_scraper.<name>.<section>[.item]"""
+        parts = prefix.split('.')
+        if len(parts) in (3, 4) and parts[0] == 'results_by_scraper' and parts[2] in self.record_file_paths:
+            return parts[1], parts[2]
+        return None
+    
+    def _is_legacy_master(self) -> bool:
+        """Stream the master file just far enough to see whether it still holds records"""
+        with open(self.master_file_path, 'rb') as f:
+            for prefix, event, _ in ijson.parse(f):
+                if event == 'start_array' and prefix.count('.') == 2 and self._legacy_record_prefix(prefix):
+                    return True
+        return False
+    
+    def _migrate_legacy_master_streaming(self):
+        """Migrate a monolithic master file record by record, without loading it whole"""
+        logger.info("Migrating records from %s to NDJSON record files...", self.master_file_path)
+        
+        meta_builder = ijson.ObjectBuilder()
+        record_builder = None
+        record_prefix = None
+        record_section = None
+        started = set()
+        targets = self._migration_targets()
+        writers = {
+            section: io.BufferedWriter(io.FileIO(tmp_path, 'w'), buffer_size=1 << 20)
+            for section, tmp_path in targets.items()
+        }
+        
+        try:
+            with open(self.master_file_path, 'rb') as f:
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    if record_builder is not None:
+                        record_builder.event(event, value)
+                        if event == 'end_map' and prefix == record_prefix:
+                            if record_section in writers:
+                                writers[record_section].write(_dumps(record_builder.value) + b'\n')
+                            record_builder = None
+                        continue
+                    
+                    match = self._legacy_record_prefix(prefix) if event == 'start_map' else None
+                    if match and prefix.endswith('.item'):
+                        scraper_name, record_section = match
+                        if match not in started and record_section in writers:
+                            # scraper_info precedes the record lists, so it is already built
+                            scraper_data = meta_builder.value['results_by_scraper'][scraper_name]
+                            session = self._legacy_session(scraper_name, scraper_data.get('scraper_info', {}))
+                            writers[record_section].write(_dumps({'_session': session}) + b'\n')
+                            started.add(match)
+                        record_prefix = prefix
+                        record_builder = ijson.ObjectBuilder()
+                        record_builder.event(event, value)
+                        continue
+                    
+                    meta_builder.event(event, value)
+        finally:
+            for writer in writers.values():
+                writer.close()
+        
+        existing_data = meta_builder.value
+        for scraper_data in existing_data.get('results_by_scraper', {}).values():
+            for section in self.record_file_paths:
+                scraper_data.pop(section, None)
+        
+        self._promote_migrated(targets)
+        _write_json(self.master_file_path, existing_data)
+    
+    def _count_records(self, existing_data: Dict[str, Any]):
+        """Compute missing per-scraper counters once from the record files"""
+        scrapers_data = existing_data.get('results_by_scraper', {})
+        counts = {name: {'announcements': 0, 'full_content': 0} for name in scrapers_data}
+        
+        for section, path in self.record_file_paths.items():
+            for scraper, group in itertools.groupby(self._iter_record_file(path), key=itemgetter(0)):
+                if scraper in counts:
+                    counts[scraper][section] += sum(1 for _ in group)
+        
+        for name, data in scrapers_data.items():
+            if 'counters' not in data:
+                data['counters'] = {
+                    'announcements': counts[name]['announcements'],
+                    'full_content': counts[name]['full_content'],
+                    'errors': len(data.get('errors', []))
+                }
+    
+    def _build_url_index(self):
+        """Index URLs per scraper in a single streaming pass over the record files"""
+        url_index = {}
+        
+        for path in self.record_file_paths.values():
+            # Records arrive in runs per session, so bulk-update one set per run
+            for scraper, group in itertools.groupby(self._iter_record_file(path), key=itemgetter(0)):
+                url_index.setdefault(scraper, set()).update(
+                    _url_hash(record['url']) for _, record in group if record.get('url')
+                )
+        
+        self._url_index = url_index
+        self._all_urls = set().union(*url_index.values())
+    
+    def _empty_master_data(self) -> Dict[str, Any]:
+        """Return the master structure for an output directory with no history"""
+        now_iso = datetime.now().isoformat()
+        return {
+            'scraping_history': {
+                'first_scrape': now_iso,
+                'last_updated': now_iso,
+                'total_scrapes': 0
+            },
+            'summary': {
+                'total_announcements': 0,
+                'total_full_content': 0,
+                'total_errors': 0
+            },
+            'results_by_scraper': {}
+        }
     
     def load_existing_data(self) -> Dict[str, Any]:
         """Load existing data from master file"""
         if not self.master_file_path.exists():
-            return {
-                'scraping_history': {
-                    'first_scrape': datetime.now().isoformat(),
-                    'last_updated': datetime.now().isoformat(),
-                    'total_scrapes': 0
-                },
-                'summary': {
-                    'total_announcements': 0,
-                    'total_full_content': 0,
-                    'total_errors': 0
-                },
-                'results_by_scraper': {}
-            }
+            return self._empty_master_data()
         
         try:
-            with open(self.master_file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            mtime = self.master_file_path.stat().st_mtime_ns
+            if self._existing_data_cache is not None and mtime == self._existing_data_mtime:
+                return self._existing_data_cache
+            
+            if ijson is not None and self._is_legacy_master():
+                self._migrate_legacy_master_streaming()
+                mtime = self.master_file_path.stat().st_mtime_ns
+            
+            existing_data = _read_json(self.master_file_path)
+            
+            scrapers_data = existing_data.get('results_by_scraper', {}).values()
+            if any('announcements' in data or 'full_content' in data for data in scrapers_data):
+                existing_data = self._migrate_legacy_master(existing_data)
+                mtime = self.master_file_path.stat().st_mtime_ns
+            if any('counters' not in data for data in scrapers_data):
+                self._count_records(existing_data)
+            
+            self._existing_data_cache = existing_data
+            self._existing_data_mtime = mtime
+            return existing_data
         except Exception as e:
-            print(f"Warning: Could not load existing data: {e}")
-            return self.load_existing_data()  # Return empty structure
+            self._set_aside_unreadable_master(e)
+            return self._empty_master_data()
     
-    def get_existing_urls(self, scraper_name: str = None) -> Set[str]:
-        """Get set of existing URLs from master file"""
-        existing_data = self.load_existing_data()
-        existing_urls = set()
+    def _set_aside_unreadable_master(self, error: Exception):
+        """Move a master file that failed to load or migrate out of the way
         
-        scrapers_to_check = [scraper_name] if scraper_name else existing_data.get('results_by_scraper', {}).keys()
+        Starting over with an empty master would otherwise overwrite it on the next
+        update, losing its history; the original is kept next to it for recovery.
+        """
+        for path in self.record_file_paths.values():
+            path.with_name(path.name + '.tmp').unlink(missing_ok=True)
         
-        for scraper in scrapers_to_check:
-            scraper_data = existing_data.get('results_by_scraper', {}).get(scraper, {})
-            
-            # Get URLs from announcements
-            for announcement in scraper_data.get('announcements', []):
-                url = announcement.get('url')
-                if url:
-                    existing_urls.add(url)
-            
-            # Get URLs from full content
-            for content in scraper_data.get('full_content', []):
-                url = content.get('url')
-                if url:
-                    existing_urls.add(url)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        corrupt_path = self.master_file_path.with_name(f"{self.master_file_path.name}.corrupt-{timestamp}")
+        os.replace(self.master_file_path, corrupt_path)
+        self._invalidate_cache()
+        logger.error("Could not load existing data from %s (%s); moved it to %s and starting a new master file",
+                     self.master_file_path, error, corrupt_path)
+    
+    def get_existing_urls(self, scraper_name: str = None) -> Set[int]:
+        """Get the set of stored URL hashes (see _url_hash)"""
+        # Make sure a legacy master file has been migrated first
+        self.load_existing_data()
+        
+        if scraper_name:
+            if self._url_index is None:
+                # Only one scraper is needed: keep just its URL hashes in memory
+                return {_url_hash(url) for url in self.get_existing_urls_streaming(scraper_name)}
+            return self._url_index.get(scraper_name, set())
+        
+        if self._url_index is None:
+            self._build_url_index()
+        return self._all_urls
+    
+    def get_existing_urls_streaming(self, scraper_name: str) -> Iterator[str]:
+        """Yield one scraper's stored URLs straight from the record files"""
+        for path in self.record_file_paths.values():
+            for record_scraper, record in self._iter_record_file(path):
+                url = record.get('url')
+                if url and record_scraper == scraper_name:
+                    yield url
+    
+    def _load_bloom(self) -> BloomDedup:
+        """Load the persisted URL filter, rebuilding it if the master file is newer"""
+        if self._bloom is not None:
+            return self._bloom
+        
+        bloom = None
+        if self.bloom_file_path.exists():
+            master_mtime = self.master_file_path.stat().st_mtime_ns if self.master_file_path.exists() else 0
+            if self.bloom_file_path.stat().st_mtime_ns >= master_mtime:
+                try:
+                    bloom = BloomDedup.from_bytes(self.bloom_file_path.read_bytes())
+                except Exception as e:
+                    logger.warning("Could not load URL filter: %s", e)
+        
+        if bloom is None or bloom.is_saturated():
+            bloom = self._rebuild_bloom()
+        
+        self._bloom = bloom
+        return bloom
+    
+    def _rebuild_bloom(self) -> BloomDedup:
+        """Build the URL filter from the master file and persist it"""
+        self.get_existing_urls()
+        total = sum(len(urls) for urls in self._url_index.values())
+        bloom = BloomDedup(capacity=max(total * 2, 100000))
+        
+        for scraper, url_hashes in self._url_index.items():
+            scoped = bloom.scoped(scraper)
+            for url_hash in url_hashes:
+                scoped.add(url_hash)
+        
+        self._save_bloom(bloom)
+        return bloom
+    
+    def _save_bloom(self, bloom: BloomDedup):
+        """Write the URL filter next to the master file"""
+        _write_bytes_atomic(self.bloom_file_path, bloom.to_bytes())
+    
+    def get_url_filter(self, scraper_name: str) -> BloomDedup:
+        """Get the duplicate pre-check filter for one scraper's URLs"""
+        return self._load_bloom().scoped(scraper_name)
+    
+    def _build_all_url_index(self) -> Dict[str, BloomDedup]:
+        """Load the shared URL filter once and scope it for every loaded scraper"""
+        bloom = self._load_bloom()
+        return {name: bloom.scoped(name) for name in self.loaded_scrapers}
+    
+    def _load_discovery_cache(self) -> Dict[str, List[Any]]:
+        """Load the {path: [mtime, class name]} map from the last discovery"""
+        if not self.discovery_cache_path.exists():
+            return {}
+        try:
+            return _read_json(self.discovery_cache_path)
+        except Exception as e:
+            logger.warning("Could not load scraper discovery cache: %s", e)
+            return {}
+    
+    def _scrapers_package(self) -> Optional[str]:
+        """Name under which the scrapers directory is importable as a package, if any"""
+        package = self.scrapers_directory.name
+        if not package.isidentifier():
+            return None
+        try:
+            spec = importlib.util.find_spec(package)
+        except (ImportError, ValueError):
+            return None
+        if spec is None or not spec.submodule_search_locations:
+            return None
+        
+        scrapers_dir = self.scrapers_directory.resolve()
+        if any(Path(location).resolve() == scrapers_dir for location in spec.submodule_search_locations):
+            return package
+        return None
+    
+    def _import_scraper_module(self, package: Optional[str], module_name: str):
+        """Import a scraper module without touching sys.path"""
+        if package:
+            return importlib.import_module(f"{package}.{module_name}")
+        
+        # Directory isn't an importable package: load the file directly
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module
         
-        return existing_urls
+        spec = importlib.util.spec_from_file_location(module_name, self.scrapers_directory / f"{module_name}.py")
+        if spec is None:
+            return None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        return module
     
     def discover_scrapers(self) -> Dict[str, BaseScraperInterface]:
         """Dynamically discover and load scraper modules"""
         scrapers = {}
         
         if not self.scrapers_directory.exists():
-            print(f"Scrapers directory not found: {self.scrapers_directory}")
+            logger.error("Scrapers directory not found: %s", self.scrapers_directory)
             return scrapers
         
-        # Add the scrapers directory to Python path temporarily
-        scrapers_path_str = str(self.scrapers_directory.absolute())
-        if scrapers_path_str not in sys.path:
-            sys.path.insert(0, scrapers_path_str)
+        scraper_names = sorted(
+            info.name for info in pkgutil.iter_modules([str(self.scrapers_directory)])
+            if info.name.endswith('_scraper') and not info.ispkg
+        )
+        logger.debug("Found %d potential scraper files", len(scraper_names))
         
-        scraper_files = list(self.scrapers_directory.glob("*_scraper.py"))
-        print(f"Found {len(scraper_files)} potential scraper files")
+        package = self._scrapers_package()
+        discovery_cache = self._load_discovery_cache()
+        new_discovery_cache = {}
         
-        for scraper_file in scraper_files:
+        for scraper_name in scraper_names:
+            scraper_file = self.scrapers_directory / f"{scraper_name}.py"
             try:
-                scraper_name = scraper_file.stem
-                spec = importlib.util.spec_from_file_location(scraper_name, scraper_file)
-                if spec is None:
-                    continue
+                cache_key = str(scraper_file.absolute())
+                mtime = scraper_file.stat().st_mtime_ns
+                cached = discovery_cache.get(cache_key)
                 
-                module = importlib.util.module_from_spec(spec)
+                module = self._import_scraper_module(package, scraper_name)
                 if module is None:
                     continue
                 
-                sys.modules[scraper_name] = module
-                spec.loader.exec_module(module)
+                # Unchanged file: go straight to the known class
+                if cached and cached[0] == mtime and hasattr(module, cached[1]):
+                    candidates = [(cached[1], getattr(module, cached[1]))]
+                else:
+                    # Look for scraper classes
+                    candidates = inspect.getmembers(module, _is_scraper_class)
                 
-                # Look for scraper classes
-                for attr_name in dir(module):
-                    if attr_name.startswith('_') or attr_name == 'BaseScraperInterface':
+                for attr_name, attr in candidates:
+                    if attr_name.startswith('_'):
                         continue
-                        
-                    attr = getattr(module, attr_name)
-                    
-                    if (isinstance(attr, type) and 
-                        hasattr(attr, '__bases__') and
-                        attr != BaseScraperInterface):
-                        
-                        # Check if it inherits from BaseScraperInterface
-                        for base in attr.__mro__:
-                            if base.__name__ == 'BaseScraperInterface':
-                                try:
-                                    scraper_instance = attr()
-                                    if hasattr(scraper_instance, 'get_scraper_info'):
-                                        scrapers[scraper_name] = scraper_instance
-                                        print(f"Loaded scraper: {scraper_name}")
-                                except Exception as e:
-                                    print(f"Error instantiating {attr_name}: {e}")
-                                break
+                    try:
+                        scraper_instance = attr()
+                        if hasattr(scraper_instance, 'get_scraper_info'):
+                            scrapers[scraper_name] = scraper_instance
+                            new_discovery_cache[cache_key] = [mtime, attr_name]
+                            logger.debug("Loaded scraper: %s", scraper_name)
+                    except Exception as e:
+                        logger.error("Error instantiating %s: %s", attr_name, e)
                         
             except Exception as e:
-                print(f"Error loading scraper {scraper_file}: {e}")
+                logger.error("Error loading scraper %s: %s", scraper_file, e)
         
-        # Clean up sys.path
-        if scrapers_path_str in sys.path:
-            sys.path.remove(scrapers_path_str)
+        if new_discovery_cache != discovery_cache:
+            try:
+                _write_json(self.discovery_cache_path, new_discovery_cache)
+            except OSError as e:
+                logger.warning("Could not save scraper discovery cache: %s", e)
         
         self.loaded_scrapers = scrapers
         return scrapers
     
     def run_scraper(self, scraper_name: str, start_date: str, end_date: str, 
-                   scrape_full_content: bool = True, **kwargs) -> ScraperResult:
-        """Run a specific scraper with deduplication"""
+                   scrape_full_content: bool = True, 
+                   existing_urls: Union[Set[int], BloomDedup, None] = None, 
+                   max_content_concurrency: int = 5, content_chunk_size: int = 10, **kwargs) -> ScraperResult:
+        """Run a specific scraper with deduplication
+        
+        Full content for new URLs is fetched in chunks of ``content_chunk_size``
+        URLs, with up to ``max_content_concurrency`` chunks in flight at once.
+        """
         
         if scraper_name not in self.loaded_scrapers:
             available = list(self.loaded_scrapers.keys())
@@ -266,45 +916,50 @@ class ScraperOrchestrator:
         scraper = self.loaded_scrapers[scraper_name]
         scraper_info = scraper.get_scraper_info()
         
-        print(f"Running scraper: {scraper_info['name']} for {scraper_info.get('website', 'Unknown')}")
+        logger.info("Running scraper: %s for %s", scraper_info['name'], scraper_info.get('website', 'Unknown'))
         
-        # Get existing URLs for this scraper
-        existing_urls = self.get_existing_urls(scraper_name)
-        print(f"Found {len(existing_urls)} existing URLs, checking for duplicates...")
+        # Get existing URLs for this scraper unless the caller precomputed them
+        if existing_urls is None:
+            existing_urls = self.get_url_filter(scraper_name)
+        if isinstance(existing_urls, BloomDedup):
+            # The filter is shared by every scraper, so only a global count is known
+            logger.info("URL filter holds ~%d known URLs across all scrapers, checking for duplicates...",
+                        len(existing_urls))
+        else:
+            logger.info("Found %d existing URLs, checking for duplicates...", len(existing_urls))
         
         # Create result container with existing URLs
         result = ScraperResult(
             scraper_info['name'], 
             scraper_info.get('website', 'Unknown'),
-            existing_urls
+            existing_urls,
+            preserve_raw_data=self.preserve_raw_data
         )
         
         try:
             # Step 1: Scrape announcements
-            print("Step 1: Scraping announcements list...")
+            logger.info("Step 1: Scraping announcements list...")
             announcements = scraper.scrape_announcements(start_date, end_date, **kwargs)
             
-            new_announcements = []
-            for announcement in announcements:
-                if result.add_announcement(announcement):
-                    new_announcements.append(announcement)
+            new_announcements = result.add_announcements_bulk(announcements)
             
-            print(f"Found {len(announcements)} total announcements")
-            print(f"Added {len(new_announcements)} new announcements")
-            print(f"Skipped {result.skipped_duplicates} duplicates")
+            logger.info("Found %d total announcements", len(announcements))
+            logger.info("Added %d new announcements", len(new_announcements))
+            logger.info("Skipped %d duplicates", result.skipped_duplicates)
             
             # Step 2: Scrape full content for new URLs only
             if scrape_full_content and new_announcements:
-                print("Step 2: Scraping full content for new items only...")
+                logger.info("Step 2: Scraping full content for new items only...")
                 new_urls = [ann.get('url', '') for ann in new_announcements if ann.get('url')]
                 
                 if new_urls:
-                    full_content_data = scraper.scrape_full_content(new_urls, **kwargs)
+                    full_content_data = self._scrape_full_content_batched(
+                        scraper, new_urls, max_content_concurrency, content_chunk_size, **kwargs
+                    )
                     
-                    for content in full_content_data:
-                        result.add_full_content(content)
+                    result.add_full_content_bulk(full_content_data)
                     
-                    print(f"Scraped full content for {len(full_content_data)} new items")
+                    logger.info("Scraped full content for %d new items", len(full_content_data))
             
             # Update statistics
             result.statistics.update({
@@ -315,99 +970,155 @@ class ScraperOrchestrator:
         except Exception as e:
             error_msg = f"Error running scraper {scraper_name}: {e}"
             result.errors.append(error_msg)
-            print(error_msg)
+            logger.error(error_msg)
         
         # Store result
         self.results[scraper_name] = result
         return result
     
-    def run_all_scrapers(self, start_date: str, end_date: str, 
-                        scrape_full_content: bool = True, **kwargs) -> Dict[str, ScraperResult]:
-        """Run all available scrapers with deduplication"""
-        results = {}
+    def _scrape_full_content_batched(self, scraper: BaseScraperInterface, urls: List[str], 
+                                     max_workers: int, chunk_size: int, **kwargs) -> List[Dict[str, Any]]:
+        """Split URLs into chunks and scrape them on a thread pool, keeping input order"""
+        chunk_size = max(1, chunk_size)
+        chunks = [urls[i:i + chunk_size] for i in range(0, len(urls), chunk_size)]
         
-        for scraper_name in self.loaded_scrapers:
-            try:
-                result = self.run_scraper(scraper_name, start_date, end_date, 
-                                        scrape_full_content, **kwargs)
-                results[scraper_name] = result
-            except Exception as e:
-                print(f"Failed to run scraper {scraper_name}: {e}")
+        if len(chunks) == 1 or max_workers <= 1:
+            return scraper.scrape_full_content(urls, **kwargs)
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            batches = executor.map(lambda chunk: scraper.scrape_full_content(chunk, **kwargs), chunks)
+            return [content for batch in batches for content in batch]
+    
+    async def run_scraper_async(self, scraper_name: str, start_date: str, end_date: str, 
+                                scrape_full_content: bool = True, 
+                                existing_urls: Union[Set[int], BloomDedup, None] = None, **kwargs) -> ScraperResult:
+        """Run a specific scraper in a worker thread"""
+        return await asyncio.to_thread(self.run_scraper, scraper_name, start_date, end_date, 
+                                       scrape_full_content, existing_urls, **kwargs)
+    
+    async def _bounded(self, sem: asyncio.Semaphore, scraper_name: str, start_date: str, end_date: str, 
+                       scrape_full_content: bool, existing_urls: Union[Set[int], BloomDedup, None], 
+                       **kwargs) -> ScraperResult:
+        """Run a scraper once a concurrency slot is free"""
+        async with sem:
+            return await self.run_scraper_async(scraper_name, start_date, end_date, 
+                                                scrape_full_content, existing_urls, **kwargs)
+    
+    async def _run_all_async(self, start_date: str, end_date: str, scrape_full_content: bool, 
+                             url_index: Dict[str, BloomDedup], **kwargs) -> Dict[str, ScraperResult]:
+        """Run all scrapers concurrently, at most max_concurrency at a time"""
+        sem = asyncio.Semaphore(self.max_concurrency)
+        scraper_names = list(self.loaded_scrapers)
+        
+        outcomes = await asyncio.gather(
+            *[self._bounded(sem, name, start_date, end_date, scrape_full_content, url_index[name], **kwargs) 
+              for name in scraper_names],
+            return_exceptions=True
+        )
+        
+        results = {}
+        for scraper_name, outcome in zip(scraper_names, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Failed to run scraper %s: %s", scraper_name, outcome)
+            else:
+                results[scraper_name] = outcome
         
         return results
     
+    def run_all_scrapers(self, start_date: str, end_date: str, 
+                        scrape_full_content: bool = True, **kwargs) -> Dict[str, ScraperResult]:
+        """Run all available scrapers concurrently with deduplication"""
+        # Build every scraper's URL filter once, before worker threads start
+        url_index = self._build_all_url_index()
+        
+        return asyncio.run(self._run_all_async(start_date, end_date, scrape_full_content, url_index, **kwargs))
+    
     def update_master_file(self, new_results: Dict[str, ScraperResult]) -> str:
-        """Update the master JSON file with new results"""
+        """Append new records and update the master file summary"""
+        
+        now_iso = datetime.now().isoformat()
         
         # Load existing data
         existing_data = self.load_existing_data()
         
         # Update metadata
-        existing_data['scraping_history']['last_updated'] = datetime.now().isoformat()
+        existing_data['scraping_history']['last_updated'] = now_iso
         existing_data['scraping_history']['total_scrapes'] = existing_data['scraping_history'].get('total_scrapes', 0) + 1
         
         # Update each scraper's data
         for scraper_name, result in new_results.items():
+            new_scraper_data = result.to_dict()
+            session = {
+                'scraper': scraper_name,
+                'session_id': result.session_id,
+                'source_website': result.website,
+                'scraped_at': result.scraped_at
+            }
+            new_counts = {
+                'announcements': len(new_scraper_data['announcements']),
+                'full_content': len(new_scraper_data['full_content']),
+                'errors': len(new_scraper_data['errors'])
+            }
+            
+            # Append new announcements and full content to the record files
+            for section, path in self.record_file_paths.items():
+                self._append_records(path, session, new_scraper_data.pop(section))
+            
             if scraper_name not in existing_data['results_by_scraper']:
-                # New scraper - add all data
-                existing_data['results_by_scraper'][scraper_name] = result.to_dict()
+                # New scraper - add its info and statistics
+                new_scraper_data['counters'] = new_counts
+                existing_data['results_by_scraper'][scraper_name] = new_scraper_data
             else:
-                # Existing scraper - append new data
+                # Existing scraper - fold in the new data
                 existing_scraper_data = existing_data['results_by_scraper'][scraper_name]
-                new_scraper_data = result.to_dict()
                 
                 # Update scraper info (in case version changed)
                 existing_scraper_data['scraper_info'].update(new_scraper_data['scraper_info'])
                 
-                # Append new announcements
-                existing_scraper_data['announcements'].extend(new_scraper_data['announcements'])
-                
-                # Append new full content
-                existing_scraper_data['full_content'].extend(new_scraper_data['full_content'])
-                
                 # Append errors
                 existing_scraper_data['errors'].extend(new_scraper_data['errors'])
                 
+                # Update running counters
+                counters = existing_scraper_data['counters']
+                for key, count in new_counts.items():
+                    counters[key] += count
+                
                 # Update statistics
-                old_stats = existing_scraper_data['statistics']
                 new_stats = new_scraper_data['statistics']
                 
                 existing_scraper_data['statistics'] = {
-                    'total_announcements': len(existing_scraper_data['announcements']),
-                    'total_full_content': len(existing_scraper_data['full_content']),
-                    'total_errors': len(existing_scraper_data['errors']),
+                    'total_announcements': counters['announcements'],
+                    'total_full_content': counters['full_content'],
+                    'total_errors': counters['errors'],
                     'last_scrape_new_items': new_stats.get('total_announcements', 0),
                     'last_scrape_skipped': new_stats.get('skipped_duplicates', 0),
                     'last_scrape_date': new_scraper_data['scraper_info']['scraped_at']
                 }
         
         # Update summary
-        total_announcements = sum(
-            len(data['announcements']) 
-            for data in existing_data['results_by_scraper'].values()
-        )
-        total_full_content = sum(
-            len(data['full_content']) 
-            for data in existing_data['results_by_scraper'].values()
-        )
-        total_errors = sum(
-            len(data['errors']) 
-            for data in existing_data['results_by_scraper'].values()
-        )
+        all_counters = [data['counters'] for data in existing_data['results_by_scraper'].values()]
         
         existing_data['summary'] = {
-            'total_announcements': total_announcements,
-            'total_full_content': total_full_content,
-            'total_errors': total_errors,
+            'total_announcements': sum(counters['announcements'] for counters in all_counters),
+            'total_full_content': sum(counters['full_content'] for counters in all_counters),
+            'total_errors': sum(counters['errors'] for counters in all_counters),
             'scrapers_count': len(existing_data['results_by_scraper']),
-            'last_updated': datetime.now().isoformat()
+            'last_updated': now_iso
         }
         
         # Save updated data
-        with open(self.master_file_path, 'w', encoding='utf-8') as f:
-            json.dump(existing_data, f, indent=2, ensure_ascii=False)
+        _write_json(self.master_file_path, existing_data)
+        self._invalidate_cache()
         
-        print(f"Master file updated: {self.master_file_path}")
+        # Record the new URLs so the next run skips them without a rebuild
+        if self._bloom is not None:
+            for scraper_name, result in new_results.items():
+                scoped = self._bloom.scoped(scraper_name)
+                for url_hash in result.new_urls | result.new_content_urls:
+                    scoped.add(url_hash)
+            self._save_bloom(self._bloom)
+        
+        logger.info("Master file updated: %s", self.master_file_path)
         return str(self.master_file_path)
     
     def generate_report(self, results: Dict[str, ScraperResult]) -> str:
@@ -473,21 +1184,31 @@ def main():
     parser.add_argument('--output-dir', default='scraped_data', help='Output directory')
     parser.add_argument('--master-file', default='master_scraped_data.json', help='Master file name')
     parser.add_argument('--no-full-content', action='store_true', help='Skip full content scraping')
+    parser.add_argument('--preserve-raw-data', action='store_true', help='Keep a full copy of each scraped record under raw_data')
+    parser.add_argument('--max-concurrency', type=int, default=5, help='Maximum number of scrapers to run at once')
+    parser.add_argument('--max-content-concurrency', type=int, default=5, help='Maximum full content batches per scraper in flight at once')
     parser.add_argument('--report-only', action='store_true', help='Generate report only')
+    parser.add_argument('--verbose', action='store_true', help='Log per-file discovery details')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    
     # Create orchestrator
-    orchestrator = ScraperOrchestrator(args.scrapers_dir, args.output_dir, args.master_file)
+    orchestrator = ScraperOrchestrator(args.scrapers_dir, args.output_dir, args.master_file,
+                                       max_concurrency=args.max_concurrency,
+                                       preserve_raw_data=args.preserve_raw_data)
     
     # Discover scrapers
     scrapers = orchestrator.discover_scrapers()
     
     if not scrapers:
-        print("No scrapers found! Please check your scrapers directory.")
+        logger.error("No scrapers found! Please check your scrapers directory.")
         sys.exit(1)
     
-    print(f"Discovered {len(scrapers)} scrapers: {list(scrapers.keys())}")
+    logger.info("Discovered %d scrapers: %s", len(scrapers), list(scrapers.keys()))
     
     # Run scrapers
     scrape_full_content = not args.no_full_content
@@ -495,17 +1216,19 @@ def main():
     if args.scraper:
         # Run specific scraper
         if args.scraper not in scrapers:
-            print(f"Scraper '{args.scraper}' not found")
+            logger.error("Scraper '%s' not found", args.scraper)
             sys.exit(1)
-        results = {args.scraper: orchestrator.run_scraper(args.scraper, args.start_date, args.end_date, scrape_full_content)}
+        results = {args.scraper: orchestrator.run_scraper(args.scraper, args.start_date, args.end_date, scrape_full_content,
+                                                          max_content_concurrency=args.max_content_concurrency)}
     else:
         # Run all scrapers
-        results = orchestrator.run_all_scrapers(args.start_date, args.end_date, scrape_full_content)
+        results = orchestrator.run_all_scrapers(args.start_date, args.end_date, scrape_full_content,
+                                                max_content_concurrency=args.max_content_concurrency)
     
     # Update master file
     if not args.report_only:
         master_file = orchestrator.update_master_file(results)
-        print(f"Data saved to master file: {master_file}")
+        logger.info("Data saved to master file: %s", master_file)
     
     # Generate and print report
     report = orchestrator.generate_report(results)
@@ -516,7 +1239,7 @@ def main():
     report_file = orchestrator.output_directory / f"report_{timestamp}.txt"
     with open(report_file, 'w', encoding='utf-8') as f:
         f.write(report)
-    print(f"Report saved to: {report_file}")
+    logger.info("Report saved to: %s", report_file)
 
 if __name__ == "__main__":
     main()
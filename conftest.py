@@ -0,0 +1 @@
+# Lets the tests import base_scraper from the repository root
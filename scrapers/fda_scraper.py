@@ -5,13 +5,156 @@ Implements BaseScraperInterface for integration with the universal scraper orche
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import time
+import functools
 import re
 from datetime import datetime
 from urllib.parse import urljoin
-import uuid
-from typing import Dict, List, Any, Optional
+import hashlib
+import os
+import multiprocessing
+import threading
+import html
+import shelve
+from pathlib import Path
+import json
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:  # lxml is optional, bs4 then uses the standard library parser
+    _HTML_PARSER = 'html.parser'
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional, listing pages then go through bs4
+    LexborHTMLParser = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the date-range filter then runs in Python
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # requests-cache is optional, every GET then hits the network
+    CachedSession = None
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_TITLE_DATE_PREFIX_RE = re.compile(r'^[A-Za-z]+ \d{1,2}, \d{4}\s*-\s*')
+_TITLE_DATE_MATCH_RE = re.compile(r'^([A-Za-z]+ \d{1,2}, \d{4})')
+_PARENT_DATE_RE = re.compile(r'([A-Za-z]+ \d{1,2}, \d{4})')
+# Used to pull visible text out of raw HTML without walking the parse tree
+_NON_TEXT_BLOCK_RE = re.compile(r'<script\b.*?</script\s*>|<style\b.*?</style\s*>|<!--.*?-->', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_CONTACT_ALT_RE = re.compile(
+    r'Media Inquiries:?\s*(?P<media>[^,\n]+)'
+    r'|Contact:?\s*(?P<contact>[^,\n]+)'
+    r'|For more information:?\s*(?P<info>[^,\n]+)'
+    r'|(?P<phone>\d{3}-\d{3}-\d{4})'
+    r'|(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+    re.IGNORECASE
+)
+
+# Category keywords in priority order; a title matching several categories gets the first
+_CATEGORY_KEYWORDS = (
+    ('Drug Safety', ('drug', 'medication', 'pharmaceutical')),
+    ('Food Safety', ('food', 'recall', 'contamination')),
+    ('Medical Device', ('medical device', 'device')),
+    ('Tobacco Products', ('tobacco', 'cigarette', 'vaping')),
+    ('Roundup', ('roundup',))
+)
+_KEYWORD_PRIORITY = {
+    keyword: priority
+    for priority, (_, keywords) in enumerate(_CATEGORY_KEYWORDS)
+    for keyword in keywords
+}
+# Zero-width lookahead so one scan reports overlapping keywords too
+_CATEGORY_KEYWORD_RE = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in _KEYWORD_PRIORITY) + '))')
+
+# CSS selectors used by _extract_full_content, as (kind, value) pairs in priority
+# order so a single walk over the tree can match them all
+_SELECTOR_GROUPS = {
+    'title': (('tag', 'h1'), ('class', 'page-title'), ('class', 'node-title'), ('class*', 'title')),
+    'date': (('tag', 'time'), ('class', 'date'), ('class', 'published'), ('class*', 'date')),
+    'content': (
+        ('class', 'field--name-body'),
+        ('class', 'content'),
+        ('class', 'node-content'),
+        ('class', 'press-release-content'),
+        ('class', 'main-content'),
+        ('tag', 'main'),
+        ('attr', ('role', 'main'))
+    ),
+    'tags': (('class', 'tags'), ('class', 'categories'), ('class', 'field--name-field-tags')),
+    'comments': (('class', 'comments'), ('class', 'comment'), ('id', 'disqus_thread'))
+}
+_INDEXED_TAG_NAMES = ('img', 'a', 'meta', 'script', 'p')
+
+
+def _selector_matches(tag, classes: List[str], selector: Tuple[str, Any]) -> bool:
+    """Match one (kind, value) selector against a tag"""
+    kind, value = selector
+    if kind == 'tag':
+        return tag.name == value
+    if kind == 'class':
+        return value in classes
+    if kind == 'class*':
+        return value in ' '.join(classes)
+    if kind == 'id':
+        return tag.get('id') == value
+    return tag.get(value[0]) == value[1]
+
+
+def _index_tags(soup: BeautifulSoup) -> Dict[str, Any]:
+    """Walk the tree once, bucketing tags by name and by every selector they match"""
+    index = {group: [[] for _ in selectors] for group, selectors in _SELECTOR_GROUPS.items()}
+    for name in _INDEXED_TAG_NAMES:
+        index[name] = []
+    
+    for node in soup.descendants:
+        name = node.name
+        if name is None:
+            continue
+        
+        if name in _INDEXED_TAG_NAMES:
+            index[name].append(node)
+        
+        classes = node.get('class') or []
+        for group, selectors in _SELECTOR_GROUPS.items():
+            matches = index[group]
+            for i, selector in enumerate(selectors):
+                if _selector_matches(node, classes, selector):
+                    matches[i].append(node)
+    
+    return index
+
+
+def _is_unwanted_block(tag) -> bool:
+    """Navigation and sidebar blocks stripped from the main content (nav, aside, .sidebar, .menu, .navigation)"""
+    if tag.name in ('nav', 'aside'):
+        return True
+    classes = tag.get('class') or []
+    return 'sidebar' in classes or 'menu' in classes or 'navigation' in classes
+
+
+def _first_live(tags: List[Any]) -> Optional[Any]:
+    """First tag that has not been decomposed since the tree was indexed"""
+    for tag in tags:
+        if not tag.decomposed:
+            return tag
+    return None
 
 from abc import ABC, abstractmethod
 class BaseScraperInterface(ABC):
@@ -31,16 +174,133 @@ class BaseScraperInterface(ABC):
         def validate_date_format(self, date_str: str) -> bool:
             pass
 
+
+def _loads(data) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _visible_text(raw_html: str) -> str:
+    """Approximate soup.get_text() with regex passes over the raw HTML"""
+    return html.unescape(_TAG_RE.sub('', _NON_TEXT_BLOCK_RE.sub('', raw_html)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_text(date_text: str) -> Optional[datetime]:
+    """Parse a date string in any of the known formats; listing pages repeat the same few dates"""
+    # Clean the text
+    date_text = _WHITESPACE_RE.sub(' ', date_text.strip())
+    
+    # Try common formats
+    formats = [
+        '%B %d, %Y',    # September 17, 2025
+        '%b %d, %Y',    # Sep 17, 2025
+        '%m/%d/%Y',     # 09/17/2025
+        '%Y-%m-%d'      # 2025-09-17
+    ]
+    
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_text, fmt)
+        except:
+            continue
+    
+    return None
+
+
+def _date_range_masks(dates: List[Optional[datetime]], start_dt: datetime, end_dt: datetime) -> Tuple[List[bool], List[bool]]:
+    """Per-date (in_range, older_than_start) flags; missing dates are neither"""
+    if np is not None:
+        values = np.array([date or 'NaT' for date in dates], dtype='datetime64[D]')
+        start = np.datetime64(start_dt.date())
+        end = np.datetime64(end_dt.date())
+        return ((values >= start) & (values <= end)).tolist(), (values < start).tolist()
+    
+    in_range = [date is not None and start_dt <= date <= end_dt for date in dates]
+    older = [date is not None and date < start_dt for date in dates]
+    return in_range, older
+
+
+def _id_for(url: str) -> str:
+    """Deterministic record id, so re-scraping a URL yields the same id"""
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+def _is_announcement_href(href: Optional[str]) -> bool:
+    """True for links to individual press announcements (not the newsroom index)"""
+    return bool(href) and (
+        '/press-announcements/' in href
+        and 'fda-newsroom' not in href
+        and not href.endswith('/press-announcements')
+    )
+
+
 class FDAScraper(BaseScraperInterface):
     """FDA Press Announcements Scraper implementing BaseScraperInterface"""
     
+    # Listing pages only need announcement links, so bs4 skips building every other tag
+    _LINK_STRAINER = SoupStrainer('a', href=_is_announcement_href)
+    
+    LISTING_URL = "https://www.fda.gov/news-events/fda-newsroom/press-announcements"
+    
+    # Response cache and ETag store live here, not in the working directory
+    CACHE_DIR = Path.home() / '.cache' / 'fda_scraper'
+    
+    # Keep-alive connections per host; also caps in-flight requests per instance
+    POOL_SIZE = 16
+    
     def __init__(self):
-        self.session = requests.Session()
+        # Replay GET responses from a local SQLite cache on re-runs
+        if CachedSession is not None:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self.session = CachedSession(
+                str(self.CACHE_DIR / 'responses'),
+                backend='sqlite',
+                expire_after=3600,
+                allowable_codes=(200,),
+                stale_if_error=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate'
         })
+        
+        # Pool enough keep-alive connections for the fetch workers and retry
+        # transient failures with backoff
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET'])
+        )
+        adapter = HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.base_url = "https://www.fda.gov"
         self.delay = 1.0  # Default delay between requests
+        # The orchestrator runs several scrape_full_content calls at once, each with
+        # its own fetch threads; never have more requests in flight than pooled connections
+        self._request_slots = threading.BoundedSemaphore(self.POOL_SIZE)
+        # Process pool shared by concurrent scrape_full_content calls, shut down
+        # once the last of them returns
+        self._parse_pool = None
+        self._parse_pool_workers = 0
+        self._parse_pool_users = 0
+        self._parse_pool_lock = threading.Lock()
+        self._seen_urls = set()  # Announcement URLs already listed during the current crawl
+        
+        # Validators and bodies of listing pages for conditional GETs; requests-cache
+        # already revalidates its own entries, so this only backs a plain Session
+        if CachedSession is not None and isinstance(self.session, CachedSession):
+            self.etag_db_path = None
+        else:
+            self.etag_db_path = self.CACHE_DIR / 'etags.db'
+        self._etag_lock = threading.Lock()
         
     def get_scraper_info(self) -> Dict[str, str]:
         """Return scraper metadata"""
@@ -61,44 +321,108 @@ class FDAScraper(BaseScraperInterface):
         except ValueError:
             return False
     
-    def _get_page(self, url: str, page: int = 0) -> Optional[BeautifulSoup]:
+    def _pause(self, response: requests.Response):
+        """Sleep between requests, except for responses served from the local cache"""
+        if not getattr(response, 'from_cache', False):
+            time.sleep(self.delay)
+    
+    def _forget_cached(self, urls: List[str]):
+        """Drop cached responses for urls so the next fetch goes to the network"""
+        if CachedSession is not None and isinstance(self.session, CachedSession):
+            self.session.cache.delete(urls=urls)
+        
+        if self.etag_db_path and self.etag_db_path.parent.exists():
+            with self._etag_lock, shelve.open(str(self.etag_db_path)) as db:
+                for url in urls:
+                    db.pop(url, None)
+    
+    def _load_validated(self, url: str) -> Optional[Dict[str, Any]]:
+        """Stored {'etag', 'last_modified', 'body'} for url, if any"""
+        try:
+            with self._etag_lock, shelve.open(str(self.etag_db_path)) as db:
+                return db.get(url)
+        except Exception as e:
+            print(f"ETag cache unavailable: {e}")
+            return None
+    
+    def _store_validated(self, url: str, response: requests.Response, body: bytes):
+        """Remember the validators and body of a 200 response for the next conditional GET"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        try:
+            with self._etag_lock, shelve.open(str(self.etag_db_path)) as db:
+                db[url] = {'etag': etag, 'last_modified': last_modified, 'body': body}
+        except Exception as e:
+            print(f"ETag cache unavailable: {e}")
+    
+    def _fetch(self, url: str, conditional: bool = False) -> bytes:
+        """GET a URL and return its decoded body, read once straight from the stream"""
+        stored = None
+        headers = {}
+        if conditional and self.etag_db_path:
+            self.etag_db_path.parent.mkdir(parents=True, exist_ok=True)
+            stored = self._load_validated(url)
+            if stored:
+                if stored['etag']:
+                    headers['If-None-Match'] = stored['etag']
+                if stored['last_modified']:
+                    headers['If-Modified-Since'] = stored['last_modified']
+        
+        # Reading response.raw skips requests' chunk join, which briefly holds the
+        # body twice, and the connection goes back to the pool as soon as we are done.
+        # The slot is held through the politeness pause so the delay still paces requests
+        with self._request_slots:
+            with self.session.get(url, timeout=30, stream=True, headers=headers) as response:
+                if response.status_code == 304 and stored:
+                    print(f"Not modified: {url}")
+                    body = stored['body']
+                else:
+                    response.raise_for_status()
+                    body = response.raw.read(decode_content=True)
+                    if conditional and self.etag_db_path:
+                        self._store_validated(url, response, body)
+            self._pause(response)
+        return body
+    
+    def _get_page(self, url: str, page: int = 0, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
         """Get a page from the FDA website"""
         try:
             if page > 0:
                 url = f"{url}?page={page}"
             
             print(f"Fetching: {url}")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            time.sleep(self.delay)
-            return BeautifulSoup(response.content, 'html.parser')
+            return BeautifulSoup(self._fetch(url, conditional=True), _HTML_PARSER, parse_only=parse_only)
         except Exception as e:
             print(f"Error fetching {url}: {e}")
             return None
     
+    def _get_page_selectolax(self, url: str, page: int = 0) -> Optional["LexborHTMLParser"]:
+        """Get a page from the FDA website as a selectolax Lexbor tree"""
+        try:
+            if page > 0:
+                url = f"{url}?page={page}"
+            
+            print(f"Fetching: {url}")
+            return LexborHTMLParser(self._fetch(url, conditional=True))
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+    
+    @staticmethod
+    def _node_text(node, strip: bool = False) -> str:
+        """Text of a selectolax node or a bs4 tag"""
+        if LexborHTMLParser is not None and not hasattr(node, 'get_text'):
+            return node.text(strip=strip)
+        return node.get_text(strip=strip)
+    
     def _parse_date(self, date_text: str) -> Optional[datetime]:
         """Parse date from text"""
         if not date_text:
             return None
-            
-        # Clean the text
-        date_text = re.sub(r'\s+', ' ', date_text.strip())
-        
-        # Try common formats
-        formats = [
-            '%B %d, %Y',    # September 17, 2025
-            '%b %d, %Y',    # Sep 17, 2025
-            '%m/%d/%Y',     # 09/17/2025
-            '%Y-%m-%d'      # 2025-09-17
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_text, fmt)
-            except:
-                continue
-        
-        return None
+        return _parse_date_text(date_text)
     
     def _clean_title(self, title_text: str) -> str:
         """Clean title by removing date prefix"""
@@ -106,7 +430,7 @@ class FDAScraper(BaseScraperInterface):
             return ""
         
         # Remove date prefix like "September 12, 2025- " or "September 12, 2025 - "
-        clean_title = re.sub(r'^[A-Za-z]+ \d{1,2}, \d{4}\s*-\s*', '', title_text)
+        clean_title = _TITLE_DATE_PREFIX_RE.sub('', title_text)
         return clean_title.strip()
     
     def _extract_date_from_title(self, title_text: str) -> Optional[datetime]:
@@ -115,7 +439,7 @@ class FDAScraper(BaseScraperInterface):
             return None
             
         # Look for date at the beginning like "September 12, 2025- "
-        date_match = re.match(r'^([A-Za-z]+ \d{1,2}, \d{4})', title_text)
+        date_match = _TITLE_DATE_MATCH_RE.match(title_text)
         if date_match:
             return self._parse_date(date_match.group(1))
         
@@ -123,85 +447,90 @@ class FDAScraper(BaseScraperInterface):
     
     def _categorize_announcement(self, title: str) -> str:
         """Categorize announcement based on title"""
-        title_lower = title.lower()
-        
-        if any(word in title_lower for word in ['drug', 'medication', 'pharmaceutical']):
-            return "Drug Safety"
-        elif any(word in title_lower for word in ['food', 'recall', 'contamination']):
-            return "Food Safety"
-        elif any(word in title_lower for word in ['medical device', 'device']):
-            return "Medical Device"
-        elif any(word in title_lower for word in ['tobacco', 'cigarette', 'vaping']):
-            return "Tobacco Products"
-        elif 'roundup' in title_lower:
-            return "Roundup"
+        best = None
+        for match in _CATEGORY_KEYWORD_RE.finditer(title.lower()):
+            priority = _KEYWORD_PRIORITY[match.group(1)]
+            if best is None or priority < best:
+                best = priority
+                if best == 0:
+                    break
         
-        return "General"
+        if best is None:
+            return "General"
+        return _CATEGORY_KEYWORDS[best][0]
     
     def _scrape_page(self, page_num: int = 0) -> List[Dict[str, Any]]:
         """Scrape one page of press announcements"""
-        url = "https://www.fda.gov/news-events/fda-newsroom/press-announcements"
-        soup = self._get_page(url, page_num)
-        
-        if not soup:
-            return []
-        
+        url = self.LISTING_URL
         announcements = []
         processed_urls = set()
+        soup = None
         
-        # Find all links that go to press announcements
-        all_links = soup.find_all('a', href=True)
+        # Find all links that go to press announcements; selectolax is much
+        # cheaper than a full bs4 tree when it is installed
+        if LexborHTMLParser is not None:
+            tree = self._get_page_selectolax(url, page_num)
+            if not tree:
+                return []
+            all_links = []
+            for node in tree.css('a[href]'):
+                href = node.attributes.get('href')
+                if _is_announcement_href(href):
+                    all_links.append((href, node))
+        else:
+            soup = self._get_page(url, page_num, parse_only=self._LINK_STRAINER)
+            if not soup:
+                return []
+            all_links = [(link['href'], link) for link in soup.find_all('a')]
         
-        for link in all_links:
-            href = link.get('href', '')
+        for href, link in all_links:
+            # Build full URL
+            if href.startswith('/'):
+                full_url = self.base_url + href
+            else:
+                full_url = href
             
-            # Check if this is a press announcement link
-            if '/press-announcements/' in href and not href.endswith('/press-announcements'):
-                if 'fda-newsroom' in href:
-                    continue
-                
-                # Build full URL
-                if href.startswith('/'):
-                    full_url = self.base_url + href
-                else:
-                    full_url = href
-                
-                if full_url in processed_urls:
-                    continue
-                processed_urls.add(full_url)
-                
-                # Get title
-                raw_title = link.get_text(strip=True)
-                if not raw_title or len(raw_title) < 10:
-                    continue
-                
-                # Extract date from title and clean title
-                date_from_title = self._extract_date_from_title(raw_title)
-                clean_title = self._clean_title(raw_title)
-                
-                # Try to find additional date info in surrounding elements
-                date_found = date_from_title
-                if not date_found:
-                    parent = link.find_parent()
-                    if parent:
-                        parent_text = parent.get_text()
-                        date_match = re.search(r'([A-Za-z]+ \d{1,2}, \d{4})', parent_text)
-                        if date_match:
-                            date_found = self._parse_date(date_match.group(1))
-                
-                # Create standardized announcement
-                announcement = {
-                    'id': str(uuid.uuid4()),
-                    'title': clean_title,
-                    'url': full_url,
-                    'date': date_found.strftime('%Y-%m-%d') if date_found else '',
-                    'category': self._categorize_announcement(clean_title),
-                    'excerpt': clean_title if len(clean_title) <= 200 else clean_title[:200] + "...",
-                    'raw_title': raw_title,
-                    'source': 'FDA Press Announcements'
-                }
-                
-                announcements.append(announcement)
+            # _seen_urls only holds pages already processed in order, so reading it
+            # from the fetch threads is safe and skips re-parsing boundary repeats
+            if full_url in processed_urls or full_url in self._seen_urls:
+                continue
+            processed_urls.add(full_url)
+            
+            # Get title
+            raw_title = self._node_text(link, strip=True)
+            if not raw_title or len(raw_title) < 10:
+                continue
+            
+            # Extract date from title and clean title
+            date_from_title = self._extract_date_from_title(raw_title)
+            clean_title = self._clean_title(raw_title)
+            
+            # Try to find additional date info in surrounding elements
+            date_found = date_from_title
+            if not date_found:
+                # In a strained bs4 tree the parent of a link is the document
+                # itself, which would match the first date on the page
+                parent = link.parent
+                if parent and parent is not soup:
+                    parent_text = self._node_text(parent)
+                    date_match = _PARENT_DATE_RE.search(parent_text)
+                    if date_match:
+                        date_found = self._parse_date(date_match.group(1))
+            
+            # Create standardized announcement
+            announcement = {
+                'id': _id_for(full_url),
+                'title': clean_title,
+                'url': full_url,
+                'date': date_found.strftime('%Y-%m-%d') if date_found else '',
+                'category': self._categorize_announcement(clean_title),
+                'excerpt': clean_title if len(clean_title) <= 200 else clean_title[:200] + "...",
+                'raw_title': raw_title,
+                'source': 'FDA Press Announcements',
+                '_date_obj': date_found  # Dropped by scrape_announcements after date filtering
+            }
+            
+            announcements.append(announcement)
         
         print(f"Found {len(announcements)} announcements on page {page_num + 1}")
         return announcements
@@ -218,48 +547,75 @@ class FDAScraper(BaseScraperInterface):
         end_dt = datetime.strptime(end_date, '%Y-%m-%d')
         
         print(f"Scraping FDA announcements from {start_date} to {end_date}")
+        self._seen_urls = set()
+        
+        if kwargs.get('force_refresh', False):
+            self._forget_cached([self.LISTING_URL] + [f"{self.LISTING_URL}?page={page}" for page in range(1, max_pages)])
         
         all_announcements = []
+        workers = min(kwargs.get('workers', 10), 10)
         
-        for page in range(max_pages):
-            page_announcements = self._scrape_page(page)
-            
-            if not page_announcements:
-                print(f"No announcements found on page {page + 1}, stopping")
-                break
-            
-            # Filter by date
-            filtered = []
-            has_older_than_start = False
-            
-            for ann in page_announcements:
-                if ann['date']:
-                    ann_date = datetime.strptime(ann['date'], '%Y-%m-%d')
+        # Fetch listing pages in parallel waves, then walk them in order so the
+        # "older than start date" cut-off still stops the crawl early
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for wave_start in range(0, max_pages, workers):
+                wave = range(wave_start, min(wave_start + workers, max_pages))
+                futures = {page: executor.submit(self._scrape_page, page) for page in wave}
+                pages = {page: future.result() for page, future in futures.items()}
+                
+                stop = False
+                for page in wave:
+                    page_announcements = pages[page]
                     
-                    if start_dt <= ann_date <= end_dt:
-                        filtered.append(ann)
-                        print(f"INCLUDED: {ann['title'][:50]}... ({ann['date']})")
-                    elif ann_date < start_dt:
-                        has_older_than_start = True
-                        print(f"TOO OLD: {ann['title'][:50]}... ({ann['date']})")
-                    else:
-                        print(f"TOO NEW: {ann['title'][:50]}... ({ann['date']})")
-                else:
-                    print(f"NO DATE: {ann['title'][:50]}... (skipping)")
-            all_announcements.extend(filtered)
-            print(f"Page {page + 1}: {len(filtered)} announcements in date range\n")
-            
-            # If we found announcements older than our start date, we can stop
-            if has_older_than_start and page > 0:
-                print("Found announcements older than start date, stopping search")
-                break
+                    if not page_announcements:
+                        print(f"No announcements found on page {page + 1}, stopping")
+                        stop = True
+                        break
+                    
+                    # Drop announcements already listed on an earlier page
+                    page_announcements = [ann for ann in page_announcements if ann['url'] not in self._seen_urls]
+                    self._seen_urls.update(ann['url'] for ann in page_announcements)
+                    
+                    # Filter by date, reusing the datetimes parsed in _scrape_page
+                    dates = [ann.pop('_date_obj') for ann in page_announcements]
+                    in_range, older = _date_range_masks(dates, start_dt, end_dt)
+                    has_older_than_start = any(older)
+                    filtered = []
+                    
+                    for ann, ann_date, included, too_old in zip(page_announcements, dates, in_range, older):
+                        if not ann_date:
+                            print(f"NO DATE: {ann['title'][:50]}... (skipping)")
+                        elif included:
+                            filtered.append(ann)
+                            print(f"INCLUDED: {ann['title'][:50]}... ({ann['date']})")
+                        elif too_old:
+                            print(f"TOO OLD: {ann['title'][:50]}... ({ann['date']})")
+                        else:
+                            print(f"TOO NEW: {ann['title'][:50]}... ({ann['date']})")
+                    all_announcements.extend(filtered)
+                    print(f"Page {page + 1}: {len(filtered)} announcements in date range\n")
+                    
+                    # If we found announcements older than our start date, we can stop
+                    if has_older_than_start and page > 0:
+                        print("Found announcements older than start date, stopping search")
+                        stop = True
+                        break
+                
+                if stop:
+                    break
         
         return all_announcements
     
-    def _extract_full_content(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _extract_full_content(self, soup: BeautifulSoup, url: str, raw_content: Optional[bytes] = None) -> Dict[str, Any]:
         """Extract comprehensive content from an FDA announcement page"""
+        # Slice the response bytes rather than re-serializing the whole tree
+        if raw_content is not None:
+            raw_html = raw_content[:5000].decode('utf-8', errors='replace')
+        else:
+            raw_html = str(soup)[:5000]
+        
         content_data = {
-            'id': str(uuid.uuid4()),
+            'id': _id_for(url),
             'url': url,
             'title': '',
             'date_published': '',
@@ -271,44 +627,35 @@ class FDAScraper(BaseScraperInterface):
             'tags': [],
             'comments': [],
             'metadata': {},
-            'raw_html': str(soup)[:5000]  # First 5k chars of HTML for debugging
+            'raw_html': raw_html  # First 5k chars of HTML for debugging
         }
         
         try:
+            # Every lookup below reads from this index instead of re-walking the tree;
+            # tags decomposed by the content cleanup are skipped like a fresh search would
+            index = _index_tags(soup)
+            
             # Extract title
-            title_selectors = ['h1', '.page-title', '.node-title', '[class*="title"]']
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    content_data['title'] = title_elem.get_text(strip=True)
+            for matches in index['title']:
+                if matches:
+                    content_data['title'] = matches[0].get_text(strip=True)
                     break
             
             # Extract publication date
-            date_selectors = ['time', '.date', '.published', '[class*="date"]']
-            for selector in date_selectors:
-                date_elem = soup.select_one(selector)
-                if date_elem:
+            for matches in index['date']:
+                if matches:
+                    date_elem = matches[0]
                     date_text = date_elem.get('datetime') or date_elem.get_text(strip=True)
                     content_data['date_published'] = date_text
                     break
             
             # Extract main content
-            content_selectors = [
-                '.field--name-body',
-                '.content',
-                '.node-content', 
-                '.press-release-content',
-                '.main-content',
-                'main',
-                '[role="main"]'
-            ]
-            
             main_content = ""
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
+            for matches in index['content']:
+                content_elem = _first_live(matches)
                 if content_elem:
                     # Remove unwanted elements
-                    for unwanted in content_elem.select('nav, aside, .sidebar, .menu, .navigation'):
+                    for unwanted in content_elem.find_all(_is_unwanted_block):
                         unwanted.decompose()
                     
                     # Get clean text content
@@ -326,9 +673,10 @@ class FDAScraper(BaseScraperInterface):
             
             # Fallback to all paragraphs
             if not main_content:
-                all_paragraphs = soup.find_all('p')
                 content_parts = []
-                for para in all_paragraphs:
+                for para in index['p']:
+                    if para.decomposed:
+                        continue
                     text = para.get_text(strip=True)
                     if text and len(text) > 20:
                         content_parts.append(text)
@@ -339,7 +687,9 @@ class FDAScraper(BaseScraperInterface):
             
             # Extract images
             images = []
-            for img in soup.find_all('img'):
+            for img in index['img']:
+                if img.decomposed:
+                    continue
                 img_data = {
                     'src': img.get('src', ''),
                     'alt': img.get('alt', ''),
@@ -353,7 +703,9 @@ class FDAScraper(BaseScraperInterface):
             
             # Extract all links
             links = []
-            for link in soup.find_all('a', href=True):
+            for link in index['a']:
+                if link.decomposed or not link.has_attr('href'):
+                    continue
                 link_data = {
                     'url': link.get('href'),
                     'text': link.get_text(strip=True),
@@ -365,41 +717,33 @@ class FDAScraper(BaseScraperInterface):
             content_data['links'] = links
             
             # Extract contact information
-            contact_patterns = [
-                r'Media Inquiries:?\s*([^,\n]+)',
-                r'Contact:?\s*([^,\n]+)', 
-                r'For more information:?\s*([^,\n]+)',
-                r'(\d{3}-\d{3}-\d{4})',  # Phone numbers
-                r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'  # Email addresses
-            ]
-            
-            full_text = soup.get_text()
-            contacts = []
-            for pattern in contact_patterns:
-                matches = re.findall(pattern, full_text, re.IGNORECASE)
-                contacts.extend(matches)
+            # Scanning the raw bytes is far cheaper than another full tree walk
+            if raw_content is not None:
+                full_text = _visible_text(raw_content.decode('utf-8', errors='replace'))
+            else:
+                full_text = soup.get_text()
+            contacts = {match.group(match.lastgroup) for match in _CONTACT_ALT_RE.finditer(full_text)}
             
-            content_data['contact_info'] = ', '.join(set(contacts)) if contacts else ''
+            content_data['contact_info'] = ', '.join(contacts) if contacts else ''
             
             # Extract tags/categories
-            tag_selectors = ['.tags a', '.categories a', '.field--name-field-tags a']
             tags = []
-            for selector in tag_selectors:
-                tag_elems = soup.select(selector)
-                for tag in tag_elems:
-                    tag_text = tag.get_text(strip=True)
-                    if tag_text:
-                        tags.append(tag_text)
+            for matches in index['tags']:
+                for container in matches:
+                    if container.decomposed:
+                        continue
+                    for tag in container.find_all('a'):
+                        tag_text = tag.get_text(strip=True)
+                        if tag_text:
+                            tags.append(tag_text)
             content_data['tags'] = list(set(tags))
             
             # Extract comments (if any comment system exists)
-            comment_selectors = ['.comments', '.comment', '#disqus_thread']
             comments = []
-            for selector in comment_selectors:
-                comment_section = soup.select_one(selector)
+            for matches in index['comments']:
+                comment_section = _first_live(matches)
                 if comment_section:
-                    comment_texts = comment_section.find_all(text=True)
-                    comment_content = ' '.join([t.strip() for t in comment_texts if t.strip()])
+                    comment_content = comment_section.get_text(' ', strip=True)
                     if comment_content:
                         comments.append({
                             'content': comment_content,
@@ -408,20 +752,22 @@ class FDAScraper(BaseScraperInterface):
             content_data['comments'] = comments
             
             # Extract metadata
-            meta_tags = soup.find_all('meta')
             metadata = {}
-            for meta in meta_tags:
+            for meta in index['meta']:
+                if meta.decomposed:
+                    continue
                 name = meta.get('name') or meta.get('property')
                 content = meta.get('content')
                 if name and content:
                     metadata[name] = content
             
             # Additional structured data
-            scripts = soup.find_all('script', type='application/ld+json')
-            for script in scripts:
+            for script in index['script']:
+                if script.decomposed or script.get('type') != 'application/ld+json' or script.string is None:
+                    continue
                 try:
-                    import json
-                    structured_data = json.loads(script.string)
+                    # orjson only accepts exact str, not bs4's NavigableString
+                    structured_data = _loads(str(script.string))
                     metadata['structured_data'] = structured_data
                     break
                 except:
@@ -434,40 +780,140 @@ class FDAScraper(BaseScraperInterface):
         
         return content_data
     
+    def _fetch_body(self, url: str) -> Optional[bytes]:
+        """Fetch one announcement page, or None if the request failed"""
+        try:
+            return self._fetch(url)
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+    
+    def _check_content(self, content: Dict[str, Any], url: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Return (content, None) if text was extracted, else (None, failed_url)"""
+        if content['full_content']:
+            print(f"Success! Extracted {content['word_count']} words from {url}")
+            return content, None
+        
+        print(f"No content extracted from {url}")
+        return None, url
+    
+    def _fetch_and_extract(self, url: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Fetch and parse one announcement page in the calling thread"""
+        body = self._fetch_body(url)
+        if body is None:
+            return None, url
+        return self._parse_in_thread(body, url)
+    
+    def _acquire_parse_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Process pool for page parsing; pair every call with _release_parse_pool"""
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                # Never fork: the fetch threads (and the orchestrator's) may hold the
+                # stdout, logging or urllib3 locks that a forked child would inherit
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._parse_pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+                self._parse_pool_workers = workers
+            elif workers != self._parse_pool_workers:
+                print(f"Parse pool already running with {self._parse_pool_workers} workers, "
+                      f"parse_workers={workers} applies once it is idle")
+            self._parse_pool_users += 1
+            return self._parse_pool
+    
+    def _release_parse_pool(self):
+        """Shut the parse pool down when no scrape_full_content call is using it"""
+        with self._parse_pool_lock:
+            self._parse_pool_users -= 1
+            if self._parse_pool_users:
+                return
+            pool, self._parse_pool = self._parse_pool, None
+        pool.shutdown()
+    
+    def _scrape_in_threads(self, executor: ThreadPoolExecutor, urls: List[str]):
+        """Yield (index, content, failed_url) with fetch and parse both done by the threads"""
+        futures = {executor.submit(self._fetch_and_extract, url): i for i, url in enumerate(urls)}
+        for future in as_completed(futures):
+            content, failed_url = future.result()
+            yield futures[future], content, failed_url
+    
+    def _parse_in_thread(self, body: bytes, url: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Parse a fetched page in the calling thread"""
+        try:
+            return self._check_content(_parse_content_bytes(body, url, self.base_url), url)
+        except Exception as e:
+            print(f"Error parsing {url}: {e}")
+            return None, url
+    
+    def _scrape_with_parse_pool(self, executor: ThreadPoolExecutor, urls: List[str], parse_workers: int):
+        """Yield (index, content, failed_url) with threads fetching and processes parsing
+        
+        Workers import this module by name, which fails when it was loaded from a file
+        outside sys.path or the caller lacks a __main__ guard; pages the pool cannot
+        parse are then parsed in this thread instead.
+        """
+        pool = self._acquire_parse_pool(parse_workers)
+        try:
+            fetches = {executor.submit(self._fetch_body, url): i for i, url in enumerate(urls)}
+            parses = {}
+            
+            # Hand each body to the pool as soon as it arrives so parsing overlaps fetching
+            for future in as_completed(fetches):
+                i = fetches[future]
+                body = future.result()
+                if body is None:
+                    yield i, None, urls[i]
+                    continue
+                try:
+                    parses[pool.submit(_parse_content_bytes, body, urls[i], self.base_url)] = i, body
+                except BrokenProcessPool:
+                    yield (i, *self._parse_in_thread(body, urls[i]))
+            
+            pool_failed = False
+            for future in as_completed(parses):
+                i, body = parses[future]
+                try:
+                    content, failed_url = self._check_content(future.result(), urls[i])
+                except Exception as e:
+                    if not pool_failed:
+                        print(f"Parse pool failed ({type(e).__name__}: {e}), parsing in threads instead")
+                        pool_failed = True
+                    content, failed_url = self._parse_in_thread(body, urls[i])
+                yield i, content, failed_url
+        finally:
+            self._release_parse_pool()
+    
     def scrape_full_content(self, announcement_urls: List[str], **kwargs) -> List[Dict[str, Any]]:
         """Scrape full content from announcement URLs"""
         delay = kwargs.get('delay', self.delay)
         self.delay = delay
+        workers = min(kwargs.get('workers', 10), 10)
+        parse_workers = kwargs.get('parse_workers', 1)
         
-        full_content = []
+        urls = [url for url in announcement_urls if url]
+        if kwargs.get('force_refresh', False):
+            self._forget_cached(urls)
+        results = [None] * len(urls)
         failed_urls = []
         
         print(f"Scraping full content from {len(announcement_urls)} URLs...")
         
-        for i, url in enumerate(announcement_urls, 1):
-            if not url:
-                continue
-                
-            print(f"Processing {i}/{len(announcement_urls)}: {url}")
+        # Each worker sleeps after its own request, staggering the request pace.
+        # Building the bs4 tree is CPU-bound and holds the GIL; parse_workers > 1 moves
+        # it to worker processes, which only pays off for large batches of pages since
+        # the pool is started and shut down again per call
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            if parse_workers > 1 and len(urls) > 1:
+                outcomes = self._scrape_with_parse_pool(executor, urls, parse_workers)
+            else:
+                outcomes = self._scrape_in_threads(executor, urls)
             
-            try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                time.sleep(delay)
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                content = self._extract_full_content(soup, url)
-                
-                if content['full_content']:
-                    full_content.append(content)
-                    print(f"Success! Extracted {content['word_count']} words")
+            for i, content, failed_url in outcomes:
+                if content is not None:
+                    results[i] = content
                 else:
-                    failed_urls.append(url)
-                    print(f"No content extracted")
-                    
-            except Exception as e:
-                failed_urls.append(url)
-                print(f"Error: {e}")
+                    failed_urls.append(failed_url)
+        
+        full_content = [content for content in results if content is not None]
         
         print(f"Successfully scraped: {len(full_content)}/{len(announcement_urls)}")
         if failed_urls:
@@ -476,6 +922,14 @@ class FDAScraper(BaseScraperInterface):
         return full_content
 
 
+def _parse_content_bytes(body: bytes, url: str, base_url: str) -> Dict[str, Any]:
+    """Parse a fetched announcement page; module-level so process pool workers can run it"""
+    # Skip __init__: parsing only needs base_url, not an HTTP session
+    parser = FDAScraper.__new__(FDAScraper)
+    parser.base_url = base_url
+    return parser._extract_full_content(BeautifulSoup(body, _HTML_PARSER), url, body)
+
+
 # Standalone usage capability for backward compatibility
 def main():
     """Standalone execution for testing/backward compatibility"""
@@ -518,9 +972,12 @@ def main():
             results['full_content'] = full_content
     
     # Save results
-    import json
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(args.output, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
     
     print(f"Results saved to {args.output}")
     print(f"Total announcements: {len(announcements)}")
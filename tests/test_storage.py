@@ -0,0 +1,133 @@
+"""Tests for the NDJSON record storage, the legacy master migration and BloomDedup"""
+
+import json
+
+import pytest
+
+import base_scraper
+from base_scraper import BloomDedup, ScraperOrchestrator, _url_hash
+
+
+def _legacy_record(scraper_name, i):
+    return {'id': f"{scraper_name}-{i}", 'url': f"https://example.com/{scraper_name}/{i}", 'title': f"Item {i}"}
+
+
+@pytest.fixture
+def legacy_master(tmp_path):
+    """Output directory holding a monolithic master file with records inline"""
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    results = {}
+    for scraper_name, count in (('alpha', 3), ('beta', 2)):
+        results[scraper_name] = {
+            'scraper_info': {'name': scraper_name, 'website': f"https://{scraper_name}.example.com",
+                             'scraped_at': '2024-01-01T00:00:00', 'session_id': f"session-{scraper_name}"},
+            'statistics': {},
+            'announcements': [_legacy_record(scraper_name, i) for i in range(count)],
+            'full_content': [_legacy_record(scraper_name, i) for i in range(count - 1)],
+            'metadata': {},
+            'errors': []
+        }
+    master = {
+        'scraping_history': {'first_scrape': '2024-01-01T00:00:00', 'last_updated': '2024-01-01T00:00:00',
+                             'total_scrapes': 1},
+        'summary': {},
+        'results_by_scraper': results
+    }
+    (output_dir / 'master.json').write_text(json.dumps(master, indent=2))
+    return output_dir
+
+
+@pytest.fixture(params=['ijson', 'no_ijson'])
+def orchestrator(request, legacy_master, tmp_path, monkeypatch):
+    """Orchestrator over the legacy master, migrating with and without ijson"""
+    if request.param == 'ijson':
+        if base_scraper.ijson is None:
+            pytest.skip("ijson is not installed")
+    else:
+        monkeypatch.setattr(base_scraper, 'ijson', None)
+    return ScraperOrchestrator(str(tmp_path / 'scrapers'), str(legacy_master), 'master.json')
+
+
+def _stored_ids(orchestrator, section):
+    return sorted(record['id'] for record in orchestrator.iter_records(section))
+
+
+def test_legacy_master_migrates_to_ndjson(orchestrator):
+    data = orchestrator.load_existing_data()
+
+    assert _stored_ids(orchestrator, 'announcements') == ['alpha-0', 'alpha-1', 'alpha-2', 'beta-0', 'beta-1']
+    assert _stored_ids(orchestrator, 'full_content') == ['alpha-0', 'alpha-1', 'beta-0']
+    assert data['results_by_scraper']['alpha']['counters']['announcements'] == 3
+    assert data['scraping_history']['total_scrapes'] == 1
+
+    # Records keep their session fields and the master no longer holds them
+    record = next(orchestrator.iter_records('announcements', 'beta'))
+    assert record['source_website'] == 'https://beta.example.com'
+    assert record['scraped_at'] == '2024-01-01T00:00:00'
+    master = json.loads(orchestrator.master_file_path.read_text())
+    assert 'announcements' not in master['results_by_scraper']['alpha']
+    assert not list(orchestrator.output_directory.glob('*.tmp'))
+
+
+def test_interrupted_migration_does_not_duplicate_records(orchestrator):
+    legacy = orchestrator.master_file_path.read_bytes()
+    orchestrator.load_existing_data()
+    expected = _stored_ids(orchestrator, 'announcements')
+
+    # Crash after the record files were promoted but before the master was slimmed,
+    # with a half-written temporary file left behind
+    orchestrator.master_file_path.write_bytes(legacy)
+    full_content_path = orchestrator.record_file_paths['full_content']
+    full_content_path.rename(full_content_path.with_name(full_content_path.name + '.tmp'))
+    with open(full_content_path.with_name(full_content_path.name + '.tmp'), 'ab') as f:
+        f.write(b'{"id": "partial')
+    orchestrator._invalidate_cache()
+
+    orchestrator.load_existing_data()
+
+    assert _stored_ids(orchestrator, 'announcements') == expected
+    assert _stored_ids(orchestrator, 'full_content') == ['alpha-0', 'alpha-1', 'beta-0']
+    assert not list(orchestrator.output_directory.glob('*.tmp'))
+
+
+def test_truncated_last_line_keeps_next_session_apart(tmp_path):
+    orchestrator = ScraperOrchestrator(str(tmp_path / 'scrapers'), str(tmp_path / 'out'), 'master.json')
+    path = orchestrator.record_file_paths['announcements']
+    orchestrator._append_records(path, {'scraper': 'alpha'}, [_legacy_record('alpha', i) for i in range(2)])
+
+    # Simulate a crash part way through writing the last record
+    path.write_bytes(path.read_bytes()[:-10])
+    orchestrator._append_records(path, {'scraper': 'beta'}, [_legacy_record('beta', 0)])
+
+    assert [(scraper, record['id']) for scraper, record in orchestrator._iter_record_file(path)] == [
+        ('alpha', 'alpha-0'), ('beta', 'beta-0')
+    ]
+
+
+def test_bloom_round_trip():
+    bloom = BloomDedup(capacity=1000)
+    urls = [_url_hash(f"https://example.com/{i}") for i in range(100)]
+    for url_hash in urls:
+        bloom.scoped('alpha').add(url_hash)
+    bloom.scoped('alpha').add(urls[0])
+
+    restored = BloomDedup.from_bytes(bloom.to_bytes())
+
+    assert len(restored) == 100
+    assert all(url_hash in restored.scoped('alpha') for url_hash in urls)
+    assert sum(url_hash in restored.scoped('beta') for url_hash in urls) == 0
+    assert (restored.capacity, restored.num_bits, restored.num_hashes) == (bloom.capacity, bloom.num_bits,
+                                                                           bloom.num_hashes)
+
+
+def test_bloom_built_with_other_hash_is_rejected(monkeypatch):
+    bloom = BloomDedup(capacity=1000)
+    bloom.add(_url_hash('https://example.com/'))
+    data = bloom.to_bytes()
+
+    other = 'blake2b' if base_scraper._url_hash_name() == 'xxh64' else 'xxh64'
+    monkeypatch.setattr(base_scraper, '_url_hash_name', lambda: other)
+
+    with pytest.raises(ValueError, match="different URL hash"):
+        BloomDedup.from_bytes(data)